@@ -11,45 +11,139 @@ What it does:
 - Designed to run in the background (e.g., via Hyprland exec-once).
 
 How it works (high-level):
-- Polls `hyprctl -j monitors` and `hyprctl -j clients` about every 0.5s.
-- Maps monitor -> active workspace -> number of visible, mapped clients.
+- Subscribes to Hyprland's event socket (.socket2.sock) and only re-checks
+  state when a relevant event arrives (workspace/monitor/window changes).
+- Bursts of events are coalesced into a single check (50ms window).
+- Fetches monitors and clients in one batched request over Hyprland's
+  command socket (.socket.sock), falling back to `hyprctl` if that fails.
+- Maps monitor -> active workspace, and finds the workspaces that have at
+  least one visible, mapped client.
 - Starts/stops Waybar processes per monitor as needed.
 - Uses a small per-monitor Waybar config that "includes" your base config and
   sets "output": ["<monitor-name>"].
 
 Requirements:
+- Python 3.11+.
 - Waybar installed and discoverable in PATH.
 - Hyprland (hyprctl must be available).
 - Your Waybar base config at ~/.config/waybar/base.jsonc
 - Your Waybar CSS at ~/.config/waybar/style.css
+
+Optional:
+- orjson, for faster JSON parsing when falling back to `hyprctl`.
 """
 
 # Standard library imports
+import asyncio  # For the event-driven main loop
 import json  # For JSON parsing and writing
 import os  # For environment variables and paths
 import signal  # For clean shutdown on SIGINT/SIGTERM
-import subprocess  # For running hyprctl and starting/stopping waybar
-import time  # For sleeping between polls
+import socket  # For talking to Hyprland's command socket
+import subprocess  # For running hyprctl
+import sys  # For checking the Python version
+from functools import lru_cache  # For computing socket paths only once
 from pathlib import Path  # For convenient filesystem path handling
-from typing import Dict, List, Set  # For type hints
+from typing import Dict, List, Set, Tuple  # For type hints
+
+# Optional third-party imports
+try:
+    from orjson import loads as json_loads  # Faster JSON parsing
+except ImportError:
+    from json import loads as json_loads  # Fall back to the standard library
 
 # The Waybar executable name (assumes it is in PATH)
 WAYBAR_BIN = "waybar"
 
+# Environment for Waybar: ours, with log noise reduced unless you set
+# WAYBAR_LOG_LEVEL yourself (remove the override if you want logs)
+WAYBAR_ENV = {
+    **os.environ,
+    "WAYBAR_LOG_LEVEL": os.environ.get("WAYBAR_LOG_LEVEL", "error"),
+}
+
 # Path to your base Waybar config (should NOT specify "output")
 BASE_CONFIG = Path.home() / ".config/waybar/config.jsonc"
 
 # Path to your Waybar CSS stylesheet
 STYLE_CSS = Path.home() / ".config/waybar/style.css"
 
+# String forms of the paths above, for building configs and command lines
+_BASE_STR = str(BASE_CONFIG)
+_STYLE_STR = str(STYLE_CSS)
+
 # Directory to store generated per-monitor Waybar wrapper configs
 CACHE_DIR = Path.home() / ".cache/autobar"
 
-# How often (in seconds) to poll Hyprland for state changes
-POLL_INTERVAL_SEC = 0.5
+# Per-monitor wrapper config: includes your base file and pins Waybar to one
+# monitor output. Laid out exactly like json.dumps(..., indent=2); the
+# (JSON-quoted) monitor name goes between the head and the tail.
+CFG_HEAD = (
+    '{\n  "include": ' + json.dumps(_BASE_STR) + ',\n  "output": [\n    '
+)
+CFG_TAIL = "\n  ]\n}"
+
+# Hyprland events that may change which monitors need Waybar
+RECONCILE_EVENTS = frozenset(
+    {
+        "workspace",
+        "moveworkspace",
+        "activespecial",
+        "focusedmon",
+        "openwindow",
+        "closewindow",
+        "movewindow",
+        "monitoradded",
+        "monitorremoved",
+    }
+)
+
+# How long (in seconds) to wait for Hyprland to answer a query
+HYPR_TIMEOUT_SEC = 2.0
+
+# Longest event line (in bytes) read from the event socket; longer lines are
+# skipped
+EVENT_LINE_LIMIT = 1024 * 1024
+
+# How long (in seconds) to let a burst of events accumulate before reconciling
+DEBOUNCE_SEC = 0.05
+
+# Delay (in seconds) before restarting a Waybar that exited on its own; it
+# doubles each time the same monitor's Waybar exits again quickly
+RESTART_DELAY_MIN_SEC = 1.0
+RESTART_DELAY_MAX_SEC = 60.0
+
+# A Waybar that stays up this long (in seconds) resets its monitor's delay
+RESTART_STABLE_SEC = 30.0
 
-# A mapping of monitor name -> running Waybar Popen process
-procs: Dict[str, subprocess.Popen] = {}
+# A mapping of monitor name -> running Waybar process
+procs: Dict[str, asyncio.subprocess.Process] = {}
+
+# A mapping of monitor name -> current restart delay
+_restart_delay: Dict[str, float] = {}
+
+# A mapping of monitor name -> earliest event loop time for the next start
+_restart_at: Dict[str, float] = {}
+
+# A mapping of monitor name -> path (as a string, ready for Waybar's command
+# line) of its generated wrapper config, known to be up to date
+_cfg_cache: Dict[str, str] = {}
+
+# Monitors left with a running Waybar by the last reconcile
+_last_need: Set[str] = set()
+
+
+@lru_cache(maxsize=None)
+def hypr_socket_path(name: str) -> str:
+    """
+    Return the path of one of Hyprland's IPC sockets for this instance.
+    """
+    # Sockets live under $XDG_RUNTIME_DIR/hypr/<instance signature>/
+    return os.path.join(
+        os.environ["XDG_RUNTIME_DIR"],
+        "hypr",
+        os.environ["HYPRLAND_INSTANCE_SIGNATURE"],
+        name,
+    )
 
 
 def run_json(args: List[str]):
@@ -58,47 +152,65 @@ def run_json(args: List[str]):
     Returns None on any error (command failure or JSON decode error).
     """
     try:
-        # Execute command and capture stdout as text
-        out = subprocess.check_output(args, text=True)
-        # Parse and return JSON
-        return json.loads(out)
+        # Execute command and capture stdout as raw bytes
+        out = subprocess.check_output(args, timeout=HYPR_TIMEOUT_SEC)
+        # Parse and return JSON (both orjson and json accept bytes directly)
+        return json_loads(out)
     except Exception:
         # On any error (e.g., hyprctl unavailable), return None
         return None
 
 
-def get_monitors():
+def hypr_request(request: bytes) -> bytes:
     """
-    Get a list of active (non-disabled) monitors from Hyprland.
-    Returns an empty list on error.
+    Send one request over Hyprland's command socket and return the raw reply.
+    Hyprland serves a single request per connection, so each call connects
+    anew; a connection dropped mid-request (e.g., during a reload) is retried
+    once before giving up. Raises socket.timeout if Hyprland does not answer.
     """
-    # Ask Hyprland for monitor info in JSON
-    data = run_json(["hyprctl", "-j", "monitors"])
-    if not data:
-        # If hyprctl failed or returned empty, return empty list
-        return []
-    # Collect non-disabled monitors (be tolerant of field differences)
-    mons = []
-    for m in data:
-        # Skip monitors that are marked disabled
-        if m.get("disabled") is True:
-            continue
-        # Keep everything else
-        mons.append(m)
-    return mons
-
-
-def get_clients():
+    path = hypr_socket_path(".socket.sock")
+    for attempt in range(2):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                # Don't wait forever on a hung compositor
+                s.settimeout(HYPR_TIMEOUT_SEC)
+                s.connect(path)
+                s.sendall(request)
+                # Hyprland closes the connection once the reply is written
+                chunks = []
+                while True:
+                    chunk = s.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            return b"".join(chunks)
+        except (ConnectionResetError, BrokenPipeError):
+            # Let the caller handle the error if the retry fails too
+            if attempt:
+                raise
+
+
+def hypr_batch() -> Tuple[list, list]:
     """
-    Get the list of all clients (windows) known to Hyprland.
-    Returns an empty list on error.
+    Fetch monitors and clients from Hyprland in a single round trip.
+    Sends a batched request over the command socket and decodes both JSON
+    replies. Falls back to running `hyprctl` twice if the socket fails.
+    Returns a (monitors, clients) tuple; either list is empty on error.
     """
-    # Query clients via hyprctl
-    data = run_json(["hyprctl", "-j", "clients"])
-    if not data:
-        # Return empty list if failed
-        return []
-    return data
+    try:
+        # "j/" asks for JSON output, ";" separates batched commands
+        reply = hypr_request(b"[[BATCH]]j/monitors;j/clients").decode().strip()
+        # Batched replies are concatenated; decode them one after the other
+        decoder = json.JSONDecoder()
+        monitors, end = decoder.raw_decode(reply)
+        clients, _ = decoder.raw_decode(reply[end:].lstrip())
+        return monitors, clients
+    except Exception:
+        # Socket unavailable or unexpected reply; ask hyprctl instead
+        return (
+            run_json(["hyprctl", "-j", "monitors"]) or [],
+            run_json(["hyprctl", "-j", "clients"]) or [],
+        )
 
 
 def monitors_needing_waybar() -> Set[str]:
@@ -108,14 +220,15 @@ def monitors_needing_waybar() -> Set[str]:
     at least one client that is mapped and not hidden.
     Returns a set of monitor names that need Waybar.
     """
-    # Get current monitors
-    mons = get_monitors()
-    # Get current clients (windows)
-    clients = get_clients()
+    # Get current monitors and clients (windows) in one request
+    mons, clients = hypr_batch()
 
     # Build a mapping: monitor name -> active workspace id
     ws_by_mon: Dict[str, int] = {}
     for m in mons:
+        # Skip monitors that are marked disabled
+        if m.get("disabled") is True:
+            continue
         # Active workspace info is an object; get it safely
         aw = m.get("activeWorkspace") or {}
         # Workspace numeric id
@@ -126,175 +239,308 @@ def monitors_needing_waybar() -> Set[str]:
         if wsid is not None and name:
             ws_by_mon[name] = wsid
 
-    # Count visible, mapped clients per workspace id
-    counts_by_ws: Dict[int, int] = {}
-    for c in clients:
-        # Determine which workspace this client is on
-        ws = (c.get("workspace") or {}).get("id")
-        if ws is None:
-            # Skip clients without a workspace id
-            continue
-        # Skip clients that are not mapped (not actually shown)
-        if not c.get("mapped", False):
-            continue
-        # Skip hidden clients (e.g., minimized or special states)
-        if c.get("hidden", False):
-            continue
-        # Increment the visible client count for this workspace
-        counts_by_ws[ws] = counts_by_ws.get(ws, 0) + 1
+    # Collect workspace ids with at least one visible, mapped client
+    # (skipping clients that are not mapped, hidden e.g. minimized, or have
+    # no workspace id)
+    occupied_ws: Set[int] = {
+        ws
+        for c in clients
+        if c.get("mapped") and not c.get("hidden")
+        for ws in [(c.get("workspace") or {}).get("id")]
+        if ws is not None
+    }
 
-    # Compute which monitors need Waybar based on counts
-    need: Set[str] = set()
-    for mon_name, wsid in ws_by_mon.items():
-        # If active workspace has at least one visible client, Waybar is needed
-        if counts_by_ws.get(wsid, 0) > 0:
-            need.add(mon_name)
-    return need
+    # Waybar is needed wherever the active workspace is occupied
+    return {
+        mon_name for mon_name, wsid in ws_by_mon.items() if wsid in occupied_ws
+    }
 
 
-def ensure_monitor_config(mon_name: str) -> Path:
+def ensure_monitor_config(mon_name: str) -> str:
     """
     Create (or update) a small Waybar config that includes the base config and
     pins Waybar to a specific monitor via the "output" field.
-    Returns the path to the generated config file.
+    The file is only written if its content changed, and each monitor is only
+    checked once per run.
+    Returns the path to the generated config file as a string.
     """
-    # Make sure cache dir exists
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Already generated (or verified) during this run
+    cached = _cfg_cache.get(mon_name)
+    if cached is not None:
+        return cached
     # Path for this monitor's wrapper config
     cfg = CACHE_DIR / f"waybar-{mon_name}.jsonc"
     # Minimal wrapper config pointing to your base file and this monitor output
-    content = {
-        # Waybar supports "include" to merge another JSON config
-        "include": str(BASE_CONFIG),
-        # Restrict this Waybar instance to a single monitor by name
-        "output": [mon_name],
-    }
-    # Write atomically: write to tmp and then replace target file
-    tmp = cfg.with_suffix(".tmp")
-    # Dump JSON with indentation for readability
-    tmp.write_text(json.dumps(content, indent=2))
-    # Atomically move temp file into place
-    tmp.replace(cfg)
-    # Return the path to the config we just created/updated
-    return cfg
+    data = (CFG_HEAD + json.dumps(mon_name) + CFG_TAIL).encode()
+    # Skip the write if an identical file is already there (e.g., from a
+    # previous run)
+    try:
+        unchanged = cfg.read_bytes() == data
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        # Make sure cache dir exists
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write atomically: write to tmp and then replace target file
+        tmp = cfg.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        # Atomically move temp file into place
+        tmp.replace(cfg)
+    # Remember the path so later starts skip all of the above
+    _cfg_cache[mon_name] = str(cfg)
+    return _cfg_cache[mon_name]
+
+
+async def ensure_monitor_config_async(mon_name: str) -> str:
+    """
+    Like ensure_monitor_config(), but runs any disk I/O in a worker thread so
+    the event loop stays responsive. Cached monitors never leave the loop.
+    """
+    cfg = _cfg_cache.get(mon_name)
+    if cfg is not None:
+        return cfg
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, ensure_monitor_config, mon_name)
 
 
-def start_waybar_for(mon_name: str):
+async def start_waybar_for(mon_name: str, on_exit):
     """
     Start a Waybar instance for the given monitor if not already running.
+    If the instance later exits on its own, it is dropped from procs and
+    on_exit() is called once its restart delay has passed.
     """
-    # If a process exists for this monitor and is still running, do nothing
-    if mon_name in procs and procs[mon_name].poll() is None:
+    # If a process exists for this monitor, it is still running; do nothing
+    if mon_name in procs:
+        return
+    loop = asyncio.get_running_loop()
+    # Waybar exited recently and is still backing off; on_exit() will wake
+    # us up again once the delay is over
+    if loop.time() < _restart_at.get(mon_name, 0.0):
         return
     # Ensure we have a per-monitor config ready
-    cfg = ensure_monitor_config(mon_name)
-    # Copy current environment so Waybar inherits necessary variables
-    env = os.environ.copy()
-    # Reduce Waybar log noise; you can remove this if you want logs
-    env.setdefault("WAYBAR_LOG_LEVEL", "error")
-    # Launch Waybar with the per-monitor config and your style.css
-    p = subprocess.Popen(
-        [WAYBAR_BIN, "-c", str(cfg), "-s", str(STYLE_CSS)],
-        env=env,
-        stdout=subprocess.DEVNULL,  # Silence stdout (optional)
-        stderr=subprocess.DEVNULL,  # Silence stderr (optional)
+    cfg = await ensure_monitor_config_async(mon_name)
+    # Launch Waybar with the per-monitor config and your style.css.
+    # Keep to options CPython can honor on its vfork() path (no preexec_fn,
+    # user, group or extra_groups), so launching does not copy our page tables
+    p = await asyncio.create_subprocess_exec(
+        WAYBAR_BIN,
+        "-c",
+        cfg,
+        "-s",
+        _STYLE_STR,
+        env=WAYBAR_ENV,
+        stdout=asyncio.subprocess.DEVNULL,  # Silence stdout (optional)
+        stderr=asyncio.subprocess.DEVNULL,  # Silence stderr (optional)
         start_new_session=True,  # Detach from this Python process group
     )
     # Record the process handle keyed by monitor name
     procs[mon_name] = p
-
-
-def stop_waybar_for(mon_name: str):
+    started = loop.time()
+
+    def exited(_fut):
+        # Only react if this process is still the tracked one (i.e., it was
+        # not stopped on purpose by stop_waybar_for)
+        if procs.get(mon_name) is not p:
+            return
+        procs.pop(mon_name)
+        # Make the next reconcile see this monitor as needing a start
+        _last_need.discard(mon_name)
+        # Back off before restarting, longer each time Waybar keeps exiting
+        # quickly (e.g., because of a broken base config)
+        now = loop.time()
+        prev = _restart_delay.get(mon_name)
+        if prev is None or now - started >= RESTART_STABLE_SEC:
+            delay = RESTART_DELAY_MIN_SEC
+        else:
+            delay = min(prev * 2, RESTART_DELAY_MAX_SEC)
+        _restart_delay[mon_name] = delay
+        _restart_at[mon_name] = now + delay
+        loop.call_later(delay, on_exit)
+
+    # Get notified by the event loop when Waybar exits instead of polling
+    asyncio.ensure_future(p.wait()).add_done_callback(exited)
+
+
+async def stop_waybar_for(mon_name: str):
     """
     Stop the Waybar instance for the given monitor if it is running.
     """
-    # Look up the process for this monitor
-    p = procs.get(mon_name)
+    # Look up the process for this monitor and stop tracking it
+    p = procs.pop(mon_name, None)
     if not p:
         # Nothing to stop
         return
     # If the process is still alive, terminate it gracefully
-    if p.poll() is None:
+    if p.returncode is None:
         try:
             # Ask Waybar to exit
             p.terminate()
-            # Wait a short while for clean shutdown
-            for _ in range(20):
-                if p.poll() is not None:
-                    break
-                time.sleep(0.05)
-            # If it still hasn't exited, force kill
-            if p.poll() is None:
+            try:
+                # Wait a short while for clean shutdown
+                await asyncio.wait_for(p.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                # If it still hasn't exited, force kill
                 p.kill()
+                await p.wait()
         except Exception:
             # Ignore any errors during shutdown
             pass
-    # Remove from our process tracking dict
-    procs.pop(mon_name, None)
 
 
-def reconcile():
+async def reconcile(on_exit):
     """
     Core loop step:
     - Decide which monitors need Waybar.
     - Start Waybar where needed.
     - Stop Waybar where not needed or where the monitor disappeared.
-    - Clean up any dead processes we may have missed.
+    on_exit is passed on to start_waybar_for().
+    Only monitors whose state changed since the last reconcile are touched.
     """
-    # Determine the set of monitor names that should have Waybar now
-    needed = monitors_needing_waybar()
+    global _last_need
+    # Determine the set of monitor names that should have Waybar now; the
+    # query blocks, so run it in a worker thread to keep the loop (and the
+    # SIGTERM handler) responsive
+    needed = await asyncio.to_thread(monitors_needing_waybar)
+    # Most events (e.g., focus changes) leave the result untouched
+    if needed == _last_need:
+        return
 
     # Stop Waybar for monitors that no longer need it (or no longer exist)
-    for mon_name in list(procs.keys()):
-        if mon_name not in needed:
-            stop_waybar_for(mon_name)
-
-    # Start Waybar for monitors that now need it
-    for mon_name in needed:
-        start_waybar_for(mon_name)
-
-    # Clean up any entries where the process has already exited
-    for mon_name, p in list(procs.items()):
-        if p.poll() is not None:
-            procs.pop(mon_name, None)
+    # and start it where it is now needed. Everything runs concurrently, so
+    # one slow Waybar does not hold up the rest (e.g., every monitor at login)
+    to_stop = _last_need - needed
+    to_start = needed - _last_need
+    results = await asyncio.gather(
+        *(stop_waybar_for(mon_name) for mon_name in to_stop),
+        *(start_waybar_for(mon_name, on_exit) for mon_name in to_start),
+        return_exceptions=True,
+    )
+    # Remember what is actually running, even if some start failed
+    _last_need = set(procs)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
-def main():
+async def listen_events(on_event):
     """
-    Entry point: verify base config exists, then enter the polling loop.
+    Read Hyprland's event socket and call on_event() for every event that may
+    affect which monitors need Waybar.
+    Returns when Hyprland closes the socket (e.g., on exit).
+    """
+    # Connect to the event socket; each line is "EVENT>>ARGS". Window titles
+    # are part of some events, so allow for long lines
+    reader, writer = await asyncio.open_unix_connection(
+        hypr_socket_path(".socket2.sock"), limit=EVENT_LINE_LIMIT
+    )
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # Line longer than the limit; it has been discarded, and any
+                # tail that arrives later is not a known event name
+                continue
+            if not line:
+                # EOF: Hyprland went away
+                return
+            # Only the event name matters; the arguments are ignored
+            event = line.split(b">>", 1)[0].decode(errors="replace")
+            if event in RECONCILE_EVENTS:
+                on_event()
+    finally:
+        writer.close()
+
+
+async def reconcile_loop(wake: asyncio.Event):
+    """
+    Run reconcile() each time the wake event is set.
+    Events arriving shortly after the first one are folded into the same
+    reconcile.
     """
-    # If the base config is missing, do not run (prevents spammy failures)
-    if not BASE_CONFIG.exists():
-        print(f"Missing base Waybar config at {BASE_CONFIG}", flush=True)
-        return
-
-    # Main polling loop, runs indefinitely
     while True:
+        # Sleep until there is something to do
+        await wake.wait()
+        # Let the rest of the burst (e.g., openwindow, movewindow,
+        # workspace) arrive, then handle it all at once
+        await asyncio.sleep(DEBOUNCE_SEC)
+        wake.clear()
         try:
             # Perform one reconciliation cycle
-            reconcile()
+            # A Waybar that exits on its own (e.g., crashed) wakes us up
+            # again so it is restarted if needed
+            await reconcile(wake.set)
         except Exception:
-            # On transient errors (e.g., during Hyprland reload), back off a bit
-            time.sleep(1.0)
-        # Sleep until next poll to reduce CPU usage
-        time.sleep(POLL_INTERVAL_SEC)
+            # On transient errors (e.g., during Hyprland reload), back off a
+            # bit and try again
+            await asyncio.sleep(1.0)
+            wake.set()
 
 
-def _shutdown(signum, frame):
+def use_pidfd_child_watcher(loop: asyncio.AbstractEventLoop):
     """
-    Signal handler to stop all Waybar instances cleanly before exit.
+    Have asyncio learn about Waybar exits through pidfds (Linux 5.3+), so the
+    kernel wakes the event loop directly when a child exits.
+    Python 3.12+ already does this by default; 3.11 otherwise parks one
+    thread per Waybar in a blocking waitpid().
     """
-    # Iterate a copy of keys to avoid modifying during iteration
-    for mon in list(procs.keys()):
-        stop_waybar_for(mon)
-    # Exit the process
-    raise SystemExit
+    if sys.version_info >= (3, 12):
+        return
+    # pidfd_open may be missing (non-Linux) or unsupported by the kernel
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    watcher = asyncio.PidfdChildWatcher()
+    watcher.attach_loop(loop)
+    asyncio.set_child_watcher(watcher)
+
+
+async def main_async():
+    """
+    Subscribe to Hyprland events and reconcile Waybar instances on change.
+    """
+    loop = asyncio.get_running_loop()
+    # Stop cleanly on Ctrl+C (SIGINT) and system stop (SIGTERM)
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, main_task.cancel)
+    # Wait for Waybar exits without helper threads
+    use_pidfd_child_watcher(loop)
+
+    # Set whenever a reconcile is due
+    wake = asyncio.Event()
+
+    # Reconcile once at startup, then only when events arrive
+    wake.set()
+    try:
+        async with asyncio.TaskGroup() as tg:
+            listener = tg.create_task(listen_events(wake.set))
+            reconciler = tg.create_task(reconcile_loop(wake))
+            # Once Hyprland goes away there is nothing left to reconcile
+            listener.add_done_callback(lambda _task: reconciler.cancel())
+    finally:
+        # Stop all Waybar instances before exiting
+        await asyncio.gather(*(stop_waybar_for(mon) for mon in list(procs)))
+
+
+def main():
+    """
+    Entry point: verify base config exists, then run the event loop.
+    """
+    # If the base config is missing, do not run (prevents spammy failures)
+    if not BASE_CONFIG.exists():
+        print(f"Missing base Waybar config at {BASE_CONFIG}", flush=True)
+        return
+
+    try:
+        asyncio.run(main_async())
+    except asyncio.CancelledError:
+        # Cancelled by SIGINT/SIGTERM; Waybar instances are already stopped
+        pass
 
 
 # Only run main when the script is executed directly (not imported)
 if __name__ == "__main__":
-    # Register signal handlers for Ctrl+C (SIGINT) and system stop (SIGTERM)
-    signal.signal(signal.SIGINT, _shutdown)
-    signal.signal(signal.SIGTERM, _shutdown)
     # Start the daemon
     main()